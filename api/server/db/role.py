@@ -13,6 +13,37 @@ class RoleModel(IDBaseModel):
     description: str = None
     resources: List[ResourceModel] = None
 
+    def resources_by_name(self):
+        """Returns this role's resources indexed by name, so lookups are hash hits instead of list scans.
+
+        Returns:
+            (dict): The role's ResourceModel objects keyed by resource name.
+        """
+        return {resource.name: resource for resource in self.resources or []}
+
+    def has_resource(self, name: str):
+        """Returns whether this role has a resource with the given name.
+
+        Args:
+            name (str): The name of the resource to look for.
+
+        Returns:
+            (bool): True if the role has the resource, False otherwise.
+        """
+        return name in self.resources_by_name()
+
+    def permissions_for(self, name: str):
+        """Returns the permissions this role grants on the named resource.
+
+        Args:
+            name (str): The name of the resource to look up.
+
+        Returns:
+            (list): The permission names for the resource, or an empty list if the role lacks it.
+        """
+        resource = self.resources_by_name().get(name)
+        return resource.permissions if resource is not None else []
+
     # def set_resources(self, new_resources, role_col: AsyncIOMotorCollection):
     #     """Adds the given list of resources to the Role object.
     #
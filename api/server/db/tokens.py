@@ -75,7 +75,5 @@ async def prune_database(walkoff_db):
     token_col = walkoff_db.tokens
 
     now = datetime.now()
-    expired = await token_col.find({"expires": {"$lte": now}}, projection={'_id': False})
-    for token in expired:
-        await token_col.delete(dict(token))
+    await token_col.delete_many({"expires": {"$lte": now}})
     NUMBER_OF_PRUNE_OPERATIONS = 0
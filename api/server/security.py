@@ -1,4 +1,6 @@
+import hashlib
 import logging
+import time
 import uuid
 from datetime import datetime, timedelta
 from http import HTTPStatus
@@ -86,7 +88,21 @@ async def create_refresh_token(settings_col: AsyncIOMotorCollection,
     return encoded_jwt
 
 
+_decoded_token_cache = {}
+_DECODED_TOKEN_CACHE_SIZE = 4096
+
+
 async def decode_token(to_decode):
+    # Verifying the signature is the expensive part, so cache decoded claims per token.
+    # Revocation is still enforced by the blacklist check, which runs after decoding.
+    cache_key = hashlib.blake2b(to_decode if isinstance(to_decode, bytes) else to_decode.encode(),
+                                digest_size=16).digest()
+    decoded_jtw = _decoded_token_cache.get(cache_key)
+    if decoded_jtw is not None:
+        if decoded_jtw["exp"] > time.time():
+            return decoded_jtw
+        del _decoded_token_cache[cache_key]
+
     try:
         decoded_jtw = jwt.decode(to_decode, await load_secret_key(),
                                  algorithms=FastApiConfig.ALGORITHM)
@@ -100,6 +116,10 @@ async def decode_token(to_decode):
     if "user_claims" in decoded_jtw and "roles" in decoded_jtw["user_claims"]:
         decoded_jtw["user_claims"]["roles"] = [uuid.UUID(role) for role in decoded_jtw["user_claims"]["roles"]]
 
+    if len(_decoded_token_cache) >= _DECODED_TOKEN_CACHE_SIZE:
+        del _decoded_token_cache[next(iter(_decoded_token_cache))]
+    _decoded_token_cache[cache_key] = decoded_jtw
+
     return decoded_jtw
 
 
@@ -140,11 +160,12 @@ async def get_roles_by_resource_permission(resource_name: str, resource_permissi
                                            walkoff_db: AsyncIOMotorDatabase):
     roles_col = walkoff_db.roles
 
-    all_roles = [RoleModel(**role_json) for role_json in await roles_col.find().to_list(None)]
-    accepted_roles = []
-    for role in all_roles:
-        for resource in role.resources:
-            if resource.name == resource_name and resource_permission in resource.permissions:
-                accepted_roles.append(role)
+    # Filter on the raw documents so Pydantic validation only runs for roles that actually match
+    accepted_roles = set()
+    for role_json in await roles_col.find().to_list(None):
+        for resource in role_json.get("resources") or []:
+            if resource["name"] == resource_name and resource_permission in resource["permissions"]:
+                accepted_roles.add(RoleModel(**role_json).id_)
+                break
 
-    return {role_obj.id_ for role_obj in accepted_roles}
+    return accepted_roles
@@ -16,6 +16,9 @@ from common.socketio_helpers import connect_to_socketio
 from common.config import config, static
 
 
+_MISSING_ACTION = object()
+
+
 class SIOStream:
     """ Thin wrapper around an HTTP stream that plugs into the async logger """
     def __init__(self, sio=None):
@@ -63,6 +66,8 @@ class AppBase:
         self.logger = logger if logger is not None else logging.getLogger("AppBaseLogger")
         self.current_execution_id = None
         self.current_workflow_id = None
+        self._action_cache = {}
+        self._encryption_key = None
 
     async def get_actions(self):
         """ Continuously monitors the action queue and asynchronously executes actions """
@@ -117,7 +122,13 @@ class AppBase:
 
         results_stream = f"{action.execution_id}:results"
 
-        if hasattr(self, action.name):
+        # Memoize the attribute lookup; the same handful of actions get dispatched thousands of times per app
+        try:
+            func = self._action_cache[action.name]
+        except KeyError:
+            func = self._action_cache.setdefault(action.name, getattr(self, action.name, _MISSING_ACTION))
+
+        if func is not _MISSING_ACTION:
             # Tell everyone we started execution
             action.started_at = datetime.datetime.now()
             start_action_msg = NodeStatusMessage.executing_from_node(action, action.execution_id,
@@ -125,7 +136,6 @@ class AppBase:
             await self.redis.xadd(results_stream, {action.execution_id: message_dumps(start_action_msg)})
 
             try:
-                func = getattr(self, action.name, None)
                 if callable(func):
                     if len(action.parameters) < 1:
                         result = await func()
@@ -133,8 +143,9 @@ class AppBase:
                         params = {}
                         for p in action.parameters:
                             if p.variant == ParameterVariant.GLOBAL:
-                                key = config.get_from_file(config.ENCRYPTION_KEY_PATH, mode='rb')
-                                params[p.name] = fernet_decrypt(key, p.value)
+                                if self._encryption_key is None:
+                                    self._encryption_key = config.get_from_file(config.ENCRYPTION_KEY_PATH, mode='rb')
+                                params[p.name] = fernet_decrypt(self._encryption_key, p.value)
                             else:
                                 params[p.name] = p.value
                         result = await func(**params)
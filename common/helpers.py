@@ -45,6 +45,8 @@ async def get_walkoff_auth_header(session, token=None, timeout=5 * 60):
             resp_json = await resp.json()
             token = resp_json["refresh_token"]
             logger.debug("Successfully logged into WALKOFF")
+            # Login already returns a fresh access token, so skip the extra refresh round-trip
+            return {"Authorization": f"Bearer {resp_json['access_token']}"}, token
 
     headers = {"Authorization": f"Bearer {token}"}
     async with session.post(url + "/auth/refresh", headers=headers, timeout=timeout) as resp:
@@ -122,20 +124,29 @@ async def send_status_update(redis, execution_id, workflow_id, message):
     #     logger.error(f"Timed out sending event to {config.SOCKETIO_URI}: {e!r}")
 
 
-def fernet_encrypt(key: bytes, string: str):
-    from cryptography.fernet import Fernet
+_fernet_cache = {}
+
+
+def get_fernet(key: bytes):
+    """Constructing a Fernet re-derives its signing/encryption keys, so reuse one instance per master key"""
+    try:
+        return _fernet_cache[key]
+    except KeyError:
+        from cryptography.fernet import Fernet
+        return _fernet_cache.setdefault(key, Fernet(b64encode(key)))
+
 
+def fernet_encrypt(key: bytes, string: str):
     if type(string) is not str:
         to_enc = json.dumps(string)
     else:
         to_enc = string
 
-    return Fernet(b64encode(key)).encrypt(to_enc.encode()).decode()
+    return get_fernet(key).encrypt(to_enc.encode()).decode()
 
 
 def fernet_decrypt(key: bytes, string: str):
-    from cryptography.fernet import Fernet
-    s = Fernet(b64encode(key)).decrypt(string.encode()).decode()
+    s = get_fernet(key).decrypt(string.encode()).decode()
     try:
         r = json.loads(s)
     except (TypeError, json.decoder.JSONDecodeError):
@@ -4,7 +4,6 @@ import enum
 import logging
 from operator import attrgetter, itemgetter
 from collections import namedtuple, deque
-from asteval import Interpreter, make_symbol_table
 
 logger = logging.getLogger("WALKOFF")
 
@@ -349,6 +348,8 @@ class Condition(Node):
         return formatted_nodes
 
     def __call__(self, parents, children, accumulator) -> str:
+        from asteval import Interpreter, make_symbol_table
+
         parent_symbols = {k: ParentSymbol(accumulator[v.id_]) for k, v in self.format_node_names(parents).items()}
         children_symbols = {k: ChildSymbol(v.id_) for k, v in self.format_node_names(children).items()}
         syms = make_symbol_table(use_numpy=False, **parent_symbols, **children_symbols)
@@ -436,6 +437,8 @@ class Transform(Node):
 
     def __call__(self, parents, accumulator) -> str:
         """ Execute an action and ship its result """
+        from asteval import Interpreter, make_symbol_table
+
         parent_symbols = {k: ParentSymbol(accumulator[v.id_]) for k, v in self.format_node_names(parents).items()}
         # children_symbols = {k: ChildSymbol(v.id_) for k, v in self.format_node_names(children).items()}
         syms = make_symbol_table(use_numpy=False, **parent_symbols)
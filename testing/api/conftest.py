@@ -64,17 +64,10 @@ def super_auth_header(api: TestClient):
 
 
 @pytest.fixture
-def unauthorized_header(api: TestClient):
-    response = api.post("http://localhost/walkoff/api/auth/login",
-                        data=json.dumps({"username": "super_admin", "password": "super_admin"}),
-                        headers={'content-type': "application/json"})
-    tokens = response.json()
-    auth_header = {"Authorization": f"Bearer {tokens['access_token']}",
-              "content-type": "application/json"}
-
+def unauthorized_header(api: TestClient, super_auth_header: dict):
     with open('testing/util/limited_role.json') as fp:
         role_json = json.load(fp)
-        api.post("http://localhost/walkoff/api/roles/", headers=auth_header, data=json.dumps(role_json))
+        api.post("http://localhost/walkoff/api/roles/", headers=super_auth_header, data=json.dumps(role_json))
 
     data2 = {
         "username": "unauth_user",
@@ -82,7 +75,7 @@ def unauthorized_header(api: TestClient):
         "active": True,
         "roles": ["00000000-0000-9766-5f6f-705f726f6c65"]
     }
-    api.post("http://localhost/walkoff/api/users/", headers=auth_header, data=json.dumps(data2))
+    api.post("http://localhost/walkoff/api/users/", headers=super_auth_header, data=json.dumps(data2))
 
     response = api.post("http://localhost/walkoff/api/auth/login",
                         data=json.dumps({"username": data2["username"], "password": data2["password"]}),
@@ -1,7 +1,7 @@
-import json
 import logging
 from http import HTTPStatus
 
+import orjson
 import yaml
 from starlette.testclient import TestClient
 
@@ -55,27 +55,28 @@ def test_update_default_roles(api: TestClient, auth_header: dict):
     elems = ["internal_user", "super_admin", "admin", "workflow_developer", "workflow_operator", "app_developer"]
 
     with open('testing/util/role.json') as fp:
-        role_json = json.load(fp)
+        role_body = orjson.dumps(orjson.loads(fp.read()))
 
     for elem in elems:
-        p = api.put(base_roles_url + elem, headers=auth_header, data=json.dumps(role_json))
+        p = api.put(base_roles_url + elem, headers=auth_header, data=role_body)
         assert p.status_code == 403
 
 
 def test_crud_new_role(api: TestClient, auth_header: dict):
     with open('testing/util/role.json') as fp:
-        role_json = json.load(fp)
+        role_json = orjson.loads(fp.read())
         role_id = role_json["id_"]
+    role_body = orjson.dumps(role_json)
 
-    p = api.post(base_roles_url, headers=auth_header, data=json.dumps(role_json))
+    p = api.post(base_roles_url, headers=auth_header, data=role_body)
     assert p.status_code == 201
 
-    p = api.get(base_roles_url + "test_role", headers=auth_header, data=json.dumps(role_json))
+    p = api.get(base_roles_url + "test_role", headers=auth_header, data=role_body)
     assert p.status_code == 200
     assert p.json()["id_"] == role_id
 
     role_json["name"] = "updated_name"
-    p = api.put(base_roles_url + "test_role", headers=auth_header, data=json.dumps(role_json))
+    p = api.put(base_roles_url + "test_role", headers=auth_header, data=orjson.dumps(role_json))
     assert p.status_code == 200
     assert p.json()["name"] == "updated_name"
 
@@ -85,12 +86,12 @@ def test_crud_new_role(api: TestClient, auth_header: dict):
 
 def test_cred_role_dne(api: TestClient, auth_header: dict):
     with open('testing/util/role.json') as fp:
-        role_json = json.load(fp)
+        role_body = orjson.dumps(orjson.loads(fp.read()))
 
-    p = api.get(base_roles_url + "404", headers=auth_header, data=json.dumps(role_json))
+    p = api.get(base_roles_url + "404", headers=auth_header, data=role_body)
     assert p.status_code == 404
 
-    p = api.put(base_roles_url + "404", headers=auth_header, data=json.dumps(role_json))
+    p = api.put(base_roles_url + "404", headers=auth_header, data=role_body)
     assert p.status_code == 404
 
     p = api.delete(base_roles_url + "404", headers=auth_header)
@@ -99,12 +100,12 @@ def test_cred_role_dne(api: TestClient, auth_header: dict):
 
 def test_unauth_cred_role_dne(api: TestClient, unauthorized_header: dict):
     with open('testing/util/role.json') as fp:
-        role_json = json.load(fp)
+        role_body = orjson.dumps(orjson.loads(fp.read()))
 
-    p = api.get(base_roles_url + "404", headers=unauthorized_header, data=json.dumps(role_json))
+    p = api.get(base_roles_url + "404", headers=unauthorized_header, data=role_body)
     assert p.status_code == 403
 
-    p = api.put(base_roles_url + "404", headers=unauthorized_header, data=json.dumps(role_json))
+    p = api.put(base_roles_url + "404", headers=unauthorized_header, data=role_body)
     assert p.status_code == 403
 
     p = api.delete(base_roles_url + "404", headers=unauthorized_header)
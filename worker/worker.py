@@ -5,7 +5,6 @@ import sys
 import signal
 from collections import deque
 from inspect import getcoroutinelocals
-from asteval import Interpreter
 
 import aiohttp
 import aioredis
@@ -265,6 +264,7 @@ class Worker:
         except ConditionException as e:
             logger.exception(f"Worker received error for {condition.name}-{self.workflow.execution_id}")
 
+            from asteval import Interpreter
             aeval = Interpreter()
             aeval(condition.conditional)
             if len(aeval.error) > 0:
@@ -341,6 +341,7 @@ class Worker:
         except TransformException as e:
             logger.exception(f"Worker received error for {transform.name}-{self.workflow.execution_id}")
 
+            from asteval import Interpreter
             aeval = Interpreter()
             aeval(transform.transform)
             if len(aeval.error) > 0: